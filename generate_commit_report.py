@@ -1,21 +1,97 @@
 import argparse
+import collections
+import concurrent.futures
+import contextlib
 import csv
 import datetime
+import fnmatch
+import functools
+import hashlib
+import io
 import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
 import textwrap
+import threading
 
 import google.genai as genai
 from dateutil.relativedelta import relativedelta
 from dotenv import load_dotenv
 
+try:
+    import pygit2
+except ImportError:  # optional; the git CLI is used instead
+    pygit2 = None
+
 # Load environment variables from .env file immediately
 load_dotenv()
 
 # --- CONFIGURATION ---
-TEMP_DIFF_FILE = "temp_commit_context.txt"
+# Summaries of already-generated reports, keyed by aliases + exact commit set
+CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "git_reporter", "reports.json"
+)
+
+# Read size used when streaming `git` output into spool files
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Every commit in the payload starts with this header; the libgit2 path and
+# the stat-only stubs fill it in Python, `git diff-tree` via COMMIT_PRETTY_FORMAT
+COMMIT_MARKER = "===COMMIT_START==="
+COMMIT_HEADER = COMMIT_MARKER + "\nAuthor: {author}\nMessage: {subject}\n"
+COMMIT_PRETTY_FORMAT = COMMIT_HEADER.format(author="%an", subject="%s").replace(
+    "\n", "%n"
+)
+
+# Commits older than the window the libgit2 walk tolerates before stopping
+CLOCK_SKEW_SLOP = 5
+
+# Commits changing more lines than this are summarized by file stats only
+MAX_COMMIT_DIFF_LINES = 5000
+
+# Rough per-request prompt budget; diffs are packed commit by commit up to it
+PROMPT_TOKEN_BUDGET = 25_000
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARKER = "\n[... diff truncated ...]\n"
+
+# Dedented once here; only the diff data is filled in per request
+PROMPT_TEMPLATE = textwrap.dedent("""
+    You are a Data Analysis AI. Your job is to analyze Git Commits and output strict JSON.
+    The input is split into reports, each starting with a line
+    "=== REPORT <id>: <name> (<period>) ===". Summarize every report separately.
+
+    INPUT DATA:
+    {diff_data}
+
+    OUTPUT FORMAT (JSON ONLY):
+    {{
+        "entries": [
+            {{
+                "report": "<id>",
+                "name": "<name>",
+                "projects": ["list", "of", "repos"],
+                "completed_summary": "Concise technical summary of work completed...",
+                "next_steps": "Inferred next steps..."
+            }}
+        ]
+    }}
+    """)
+FOLLOW_UP_PROMPT_TEMPLATE = textwrap.dedent("""
+    More commits follow, grouped under the same "=== REPORT <id>: <name> (<period>) ==="
+    headers as before. A report may continue from the previous message. Analyze only
+    these commits and reply in the same JSON format as before, with one entry per
+    report that appears below (JSON ONLY).
+
+    INPUT DATA:
+    {diff_data}
+    """)
+
+# Markdown fence the model sometimes wraps its JSON reply in
+CODE_FENCE_RE = re.compile(r"\A\s*```(?:json)?|```\s*\Z")
 
 # Files to exclude to keep diffs readable
 IGNORED_FILES = [
@@ -29,21 +105,31 @@ IGNORED_FILES = [
     "*.min.js",
 ]
 
+# Built once and shared by every git invocation
+EXCLUDE_PATHSPEC = ("--", *(f":(exclude){ignore}" for ignore in IGNORED_FILES))
+
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
         description="Generate report using git diffs and Gemini API."
     )
-    parser.add_argument("--name", required=True, help="Display name for the report.")
-    parser.add_argument(
-        "--aliases", required=True, help="Author aliases (comma-separated)."
-    )
+    parser.add_argument("--name", help="Display name for the report.")
+    parser.add_argument("--aliases", help="Author aliases (comma-separated).")
     parser.add_argument("--repos", nargs="+", default=["."], help="List of repo paths.")
     parser.add_argument(
         "--output", default="Engineering_Value_Report.csv", help="Output CSV path."
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached report summaries and re-summarize everything.",
+    )
+    parser.add_argument(
+        "--batch-config",
+        help="JSON file listing several reports to generate in one AI request.",
+    )
 
-    date_group = parser.add_mutually_exclusive_group(required=True)
+    date_group = parser.add_mutually_exclusive_group()
     date_group.add_argument(
         "--last-month", action="store_true", help="Auto-select previous month."
     )
@@ -51,11 +137,19 @@ def parse_arguments():
         "--dates", nargs=2, metavar=("START", "END"), help="YYYY-MM-DD range."
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not args.batch_config:
+        if not (args.name and args.aliases):
+            parser.error("--name and --aliases are required without --batch-config")
+        if not (args.last_month or args.dates):
+            parser.error(
+                "one of --last-month or --dates is required without --batch-config"
+            )
+    return args
 
 
-def calculate_dates(args):
-    if args.last_month:
+def calculate_dates(last_month, dates):
+    if last_month:
         today = datetime.date.today()
         first_of_current = today.replace(day=1)
         start_date = first_of_current - relativedelta(months=1)
@@ -67,110 +161,582 @@ def calculate_dates(args):
             month_label,
         )
     else:
-        start_str, end_str = args.dates
+        start_str, end_str = dates
         return start_str, end_str, start_str
 
 
-def get_git_commits_with_diffs(aliases, start, end, repo_path):
-    if not os.path.exists(repo_path):
+def make_report_job(name, aliases, repos, last_month, dates):
+    if isinstance(aliases, str):
+        aliases = aliases.split(",")
+    start, end, month_label = calculate_dates(last_month, dates)
+    return {
+        "name": name,
+        "alias_list": [a.strip() for a in aliases],
+        "repos": repos,
+        "start": start,
+        "end": end,
+        "month_label": month_label,
+    }
+
+
+def load_batch_config(path):
+    """
+    Reads a JSON list of report entries shaped like the single-report flags:
+    {"name", "aliases", "repos", and either "dates": [START, END] or
+    "last_month": true}.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError("expected a JSON list of report entries")
+
+    jobs = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"report entry {entry!r} is not an object")
+        name = entry.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"entry {entry!r} needs a name")
+
+        aliases = entry.get("aliases")
+        if not _is_str_or_str_list(aliases):
+            raise ValueError(f"entry {name!r} needs aliases as a string or list")
+
+        repos = entry.get("repos", ["."])
+        if isinstance(repos, str):
+            repos = [repos]
+        if not _is_str_or_str_list(repos):
+            raise ValueError(f"entry {name!r} needs repos as a list of paths")
+
+        last_month = entry.get("last_month", False)
+        dates = entry.get("dates")
+        if not last_month and not dates:
+            raise ValueError(f"entry {name!r} needs dates or last_month")
+        if dates and not (
+            isinstance(dates, list)
+            and len(dates) == 2
+            and all(isinstance(d, str) for d in dates)
+        ):
+            raise ValueError(f"entry {name!r} needs dates as [START, END]")
+
+        jobs.append(make_report_job(name, aliases, repos, last_month, dates))
+    return jobs
+
+
+def _is_str_or_str_list(value):
+    if isinstance(value, str):
+        return True
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+
+def get_git_commits_with_diffs(alias_list, start, end, repo_path, outfile):
+    """
+    Streams the repo's commit diffs into the binary file object `outfile`.
+    Returns the SHAs of all matching commits.
+    """
+    if not os.path.isdir(repo_path):
         print(f"Warning: Path {repo_path} not found.")
-        return None
+        return []
+
+    repo_name = os.path.basename(os.path.normpath(repo_path))
+    if repo_name in ("", os.curdir, os.pardir):
+        # Only paths like "." or ".." need resolving against the filesystem.
+        repo_name = os.path.basename(os.path.realpath(repo_path))
+    repo_header = f"\n--- REPOSITORY: {repo_name} ---\n".encode("utf-8")
+
+    # The libgit2 path is its own zero-commit short-circuit: its walk is lazy,
+    # stops a few commits past the window and only diffs commits that pass the
+    # date and author filters, so an inactive repo costs a handful of commit
+    # reads. The rev-list probe below only guards the CLI passes.
+    if pygit2 is not None:
+        start_pos = outfile.tell()
+        try:
+            return _collect_with_libgit2(
+                repo_path, repo_header, alias_list, start, end, outfile
+            )
+        except (pygit2.GitError, ValueError, re.error):
+            # Fall back to the git CLI, dropping anything written so far.
+            outfile.seek(start_pos)
+            outfile.truncate()
+
+    log_filters = [
+        f"--since={_day_start(start)}",
+        f"--until={_day_start(end)}",
+        "--no-merges",
+        "--extended-regexp",
+        f"--author={_author_regex(alias_list)}",
+    ]
+
+    # Probe without the pathspec first: limiting by paths makes git diff every
+    # commit's tree in the window, which is wasted when the authors have no
+    # commits there at all.
+    try:
+        probe = subprocess.run(
+            ["git", "rev-list", "--count", *log_filters, "HEAD"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        return []
+    if probe.stdout.strip() == "0":
+        return []
+
+    # Cheap first pass: commit ids plus per-file line counts, no patch text.
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "log",
+                "--numstat",
+                "--no-renames",
+                "--pretty=format:%x00%H%x1f%an%x1f%s",
+                *log_filters,
+                *EXCLUDE_PATHSPEC,
+            ],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            errors="replace",
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        return []
+    commits = _parse_numstat_log(result.stdout)
+    shas = [commit[0] for commit in commits]
+    if not commits:
+        return shas
+
+    patch_shas = []
+    stat_only = []
+    for commit in commits:
+        if _wants_full_diff(commit[3]):
+            patch_shas.append(commit[0])
+        else:
+            stat_only.append(commit)
+
+    outfile.write(repo_header)
+    if patch_shas and not _write_patches(patch_shas, repo_path, outfile):
+        return []
+    for _, author, subject, stats in stat_only:
+        outfile.write(_format_stat_only_commit(author, subject, stats).encode("utf-8"))
+    return shas
+
+
+def collect_repo_spool(alias_list, start, end, repo_path):
+    """
+    Runs get_git_commits_with_diffs into a fresh spool file.
+    Returns (shas, spool); spool is None when no commits matched, so only
+    repos with output hold a file descriptor.
+    """
+    spool = tempfile.TemporaryFile()
+    try:
+        shas = get_git_commits_with_diffs(alias_list, start, end, repo_path, spool)
+    except BaseException:
+        spool.close()
+        raise
+    if not shas:
+        spool.close()
+        return shas, None
+    spool.seek(0)
+    return shas, spool
+
+
+def _day_start(date_str):
+    """
+    git fills in the current time of day for a bare YYYY-MM-DD, which would
+    make the window depend on when the script runs. Pin such dates to local
+    midnight, the same boundary the libgit2 path uses.
+    """
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_str):
+        return f"{date_str} 00:00:00"
+    return date_str
+
+
+def _collect_with_libgit2(repo_path, repo_header, alias_list, start, end, outfile):
+    """
+    In-process equivalent of the git CLI passes, reading objects through
+    libgit2. Dates are taken as local midnight and compared with the commit
+    time; aliases are matched against "Name <email>" like --author.
+    """
+    git_dir = pygit2.discover_repository(repo_path)
+    if git_dir is None:
+        raise pygit2.GitError(f"{repo_path} is not a git repository")
+    repo = pygit2.Repository(git_dir)
+
+    since = datetime.datetime.strptime(start, "%Y-%m-%d").timestamp()
+    until = datetime.datetime.strptime(end, "%Y-%m-%d").timestamp()
+    author_pattern = re.compile(_author_regex(alias_list))
+
+    shas = []
+    stat_only = []
+    wrote_header = False
+    wrote_patch = False
+    # Unsorted walks are lazy (libgit2 still visits commits newest-first by
+    # date); any sort flag makes it read the whole history up front. Like git's
+    # own --since cutoff, keep going past a few older commits to tolerate clock
+    # skew before concluding the window is exhausted.
+    old_streak = 0
+    for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_NONE):
+        if commit.commit_time < since:
+            old_streak += 1
+            if old_streak > CLOCK_SKEW_SLOP:
+                break
+            continue
+        old_streak = 0
+        if commit.commit_time > until or len(commit.parents) > 1:
+            continue
+        author = f"{commit.author.name} <{commit.author.email}>"
+        if not author_pattern.search(author):
+            continue
+
+        if commit.parents:
+            diff = repo.diff(commit.parents[0], commit)
+        else:
+            diff = commit.tree.diff_to_tree(swap=True)
+        patches = [
+            patch for patch in diff if not _is_ignored(patch.delta.new_file.path)
+        ]
+        if not patches:
+            continue
+
+        shas.append(str(commit.id))
+
+        stats = []
+        for patch in patches:
+            if patch.delta.is_binary:
+                stats.append((None, None, patch.delta.new_file.path))
+            else:
+                _, added, deleted = patch.line_stats
+                stats.append((added, deleted, patch.delta.new_file.path))
+
+        if not wrote_header:
+            outfile.write(repo_header)
+            wrote_header = True
+        subject = commit.message.split("\n\n", 1)[0].replace("\n", " ").strip()
+        if not _wants_full_diff(stats):
+            stat_only.append((commit.author.name, subject, stats))
+            continue
+        header = COMMIT_HEADER.format(author=commit.author.name, subject=subject)
+        # Same layout as `git diff-tree`: a blank line between commits.
+        if wrote_patch:
+            outfile.write(b"\n")
+        outfile.write(header.encode("utf-8") + b"\n")
+        for patch in patches:
+            outfile.write(patch.data)
+        wrote_patch = True
+
+    for author, subject, stats in stat_only:
+        outfile.write(_format_stat_only_commit(author, subject, stats).encode("utf-8"))
+    return shas
+
+
+def _author_regex(alias_list):
+    """
+    Builds a single alternation matching any alias literally, written so that
+    both git's POSIX extended regexes and Python's re read it the same way.
+    """
+    escaped = [
+        re.sub(r"([][.*+?^$(){}|\\])", r"\\\1", alias) for alias in alias_list if alias
+    ]
+    return "(" + "|".join(escaped) + ")"
+
+
+def _is_ignored(path):
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in IGNORED_FILES)
 
-    repo_name = os.path.basename(os.path.abspath(repo_path))
-    alias_list = [a.strip() for a in aliases.split(",")]
 
+def _parse_numstat_log(output):
+    """
+    Parses `git log --numstat` output produced with the NUL-prefixed header
+    format into (sha, author, subject, stats) tuples. Each stat is an
+    (added, deleted, path) triple; added/deleted are None for binary files.
+    """
+    commits = []
+    for record in output.split("\0")[1:]:
+        header, _, body = record.partition("\n")
+        sha, author, subject = header.split("\x1f", 2)
+        stats = []
+        for line in body.splitlines():
+            if not line:
+                continue
+            added, deleted, path = line.split("\t", 2)
+            if added == "-":
+                stats.append((None, None, path))
+            else:
+                stats.append((int(added), int(deleted), path))
+        commits.append((sha, author, subject, stats))
+    return commits
+
+
+def _wants_full_diff(stats):
+    text_stats = [stat for stat in stats if stat[0] is not None]
+    if not text_stats:
+        return False
+    changed = sum(added + deleted for added, deleted, _ in text_stats)
+    return changed <= MAX_COMMIT_DIFF_LINES
+
+
+def _format_stat_only_commit(author, subject, stats):
+    lines = [
+        COMMIT_HEADER.format(author=author, subject=subject),
+        "Diff omitted (binary or too large). Files changed:",
+    ]
+    for added, deleted, path in stats:
+        if added is None:
+            lines.append(f"  {path} (binary)")
+        else:
+            lines.append(f"  {path} (+{added} -{deleted})")
+    return "\n" + "\n".join(lines) + "\n"
+
+
+def _write_patches(shas, repo_path, outfile):
+    """
+    Renders every patch through a single `git diff-tree --stdin` process,
+    instead of paying git's startup cost per commit.
+    """
     cmd = [
         "git",
-        "log",
+        "diff-tree",
+        "--stdin",
         "-p",
+        "--root",
         "--no-color",
-        f"--since={start}",
-        f"--until={end}",
-        "--pretty=format:===COMMIT_START===%nAuthor: %an%nMessage: %s%n",
-        "--no-merges",
+        "--no-renames",
+        f"--pretty=format:{COMMIT_PRETTY_FORMAT}",
+        *EXCLUDE_PATHSPEC,
     ]
-    for alias in alias_list:
-        cmd.append(f"--author={alias}")
 
-    cmd.append("--")
-    for ignore in IGNORED_FILES:
-        cmd.append(f":(exclude){ignore}")
+    # stderr is discarded rather than piped so a chatty git can't fill the pipe
+    # and stall while we are only draining stdout.
+    proc = subprocess.Popen(
+        cmd,
+        cwd=repo_path,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=STREAM_CHUNK_SIZE,
+    )
+    with proc:
+        # Feed from a separate thread so a long sha list can't deadlock against
+        # a full stdout pipe.
+        feeder = threading.Thread(target=_feed_shas, args=(proc.stdin, shas))
+        feeder.start()
+        shutil.copyfileobj(proc.stdout, outfile, length=STREAM_CHUNK_SIZE)
+        feeder.join()
+    return proc.returncode == 0
+
 
+def _feed_shas(stdin, shas):
+    with contextlib.suppress(BrokenPipeError):
+        stdin.write("".join(f"{sha}\n" for sha in shas).encode("ascii"))
+    with contextlib.suppress(BrokenPipeError):
+        stdin.close()
+
+
+def load_report_cache(path):
     try:
-        result = subprocess.run(
-            cmd, cwd=repo_path, capture_output=True, text=True, check=True
-        )
-        raw_output = result.stdout.strip()
-        if not raw_output:
-            return None
-        return f"\n--- REPOSITORY: {repo_name} ---\n{raw_output}"
-    except subprocess.CalledProcessError:
-        return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 
+def report_cache_key(alias_list, shas):
+    """
+    A cached summary only describes the exact commits it was generated from,
+    so it is keyed by the author aliases plus the full sorted SHA set.
+    """
+    material = json.dumps([sorted(alias_list), sorted(shas)])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def save_report_cache(cache, path):
+    """
+    Writes the cache to a sibling temp file first and swaps it in with
+    os.replace, so an interrupted run never leaves a truncated cache behind.
+    """
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not update cache {path}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
 
-def run_gemini_pipeline(context_file_path):
+
+def merge_ai_results(results):
+    """
+    Combines several AI responses into one: projects are unioned in order of
+    first appearance, summaries and next steps are concatenated.
     """
-    Reads the temp file and sends it to Gemini API directly.
+    projects = []
+    summaries = []
+    next_steps = []
+    for data in results:
+        data_projects = data.get("projects", [])
+        if not isinstance(data_projects, list):
+            data_projects = [data_projects]
+        for project in data_projects:
+            if project not in projects:
+                projects.append(project)
+        summary = data.get("completed_summary", "")
+        if summary and summary not in summaries:
+            summaries.append(summary)
+        steps = data.get("next_steps", "")
+        if steps and steps not in next_steps:
+            next_steps.append(steps)
+
+    return {
+        "projects": projects,
+        "completed_summary": "\n".join(summaries),
+        "next_steps": "\n".join(next_steps),
+    }
+
+
+def _pack_prompt_batches(diff_data, max_chars):
     """
+    Splits the payload on commit boundaries and greedily packs whole commits
+    into batches of at most `max_chars`. A commit that is too large on its own
+    is truncated. Each batch repeats the report and repository headers of its
+    first commit so the model always knows whose work and which repo a diff
+    belongs to.
+    """
+    batches = []
+    current = []
+    current_len = 0
+    current_context = None
+    report_header = ""
+    repo_header = ""
+    for piece in re.split(
+        rf"(?m)^(?==== REPORT |--- REPOSITORY: |{COMMIT_MARKER})", diff_data
+    ):
+        if piece.startswith("=== REPORT "):
+            report_header = piece
+            continue
+        if piece.startswith("--- REPOSITORY: "):
+            repo_header = piece
+            continue
+        if not piece.strip():
+            continue
+
+        context = (report_header, repo_header)
+        piece_limit = max_chars - len(report_header) - len(repo_header)
+        if len(piece) > piece_limit:
+            piece = piece[: piece_limit - len(TRUNCATION_MARKER)] + TRUNCATION_MARKER
+
+        if current_context is None or report_header != current_context[0]:
+            headers = [report_header, repo_header]
+        elif repo_header != current_context[1]:
+            headers = [repo_header]
+        else:
+            headers = []
+        headers_len = sum(len(header) for header in headers)
+        if current and current_len + headers_len + len(piece) > max_chars:
+            batches.append("".join(current))
+            current = []
+            current_len = 0
+            headers = [report_header, repo_header]
+            headers_len = len(report_header) + len(repo_header)
+        current.extend(headers)
+        current.append(piece)
+        current_len += headers_len + len(piece)
+        current_context = context
+
+    if current:
+        batches.append("".join(current))
+    return batches
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         print(
             "Error: GOOGLE_API_KEY not found. Please set it in a .env file or environment variable."
         )
         sys.exit(1)
-    client = genai.Client(api_key=api_key)
-    chat = client.chats.create(model="gemini-2.5-flash")
-
-    with open(context_file_path, "r", encoding="utf-8") as f:
-        diff_data = f.read()
+    return genai.Client(api_key=api_key)
 
-    prompt = textwrap.dedent(f"""
-    You are a Data Analysis AI. Your job is to analyze Git Commits and output strict JSON.
-
-    INPUT DATA:
-    {diff_data[:100000]}
 
-    OUTPUT FORMAT (JSON ONLY):
-    {{
-        "projects": ["list", "of", "repos"],
-        "completed_summary": "Concise technical summary of work completed...",
-        "next_steps": "Inferred next steps..."
-    }}
-    """)
+def run_gemini_pipeline(diff_data, report_ids):
+    """
+    Sends the collected commit diffs to Gemini API directly. The payload holds
+    one "=== REPORT <id> ===" section for each of `report_ids`, and the reply
+    is returned as {report id: summary}. Payloads larger than the prompt
+    budget are sent as several messages on the same chat and the JSON replies
+    are merged per report. With a single report, a flat reply or one with a
+    missing or rewritten report id is still attributed to it.
+    """
+    chat = _get_client().chats.create(model="gemini-2.5-flash")
+
+    batches = _pack_prompt_batches(diff_data, PROMPT_TOKEN_BUDGET * CHARS_PER_TOKEN)
+    entries_by_report = {}
+    for index, batch in enumerate(batches):
+        if index == 0:
+            prompt = PROMPT_TEMPLATE.format(diff_data=batch)
+        else:
+            print(f"Sending batch {index + 1}/{len(batches)}...")
+            prompt = FOLLOW_UP_PROMPT_TEMPLATE.format(diff_data=batch)
+
+        try:
+            response = chat.send_message(prompt)
+            text = CODE_FENCE_RE.sub("", response.text)
+            print(text)
+            reply = json.loads(text)
+            entries = reply.get("entries")
+            if not isinstance(entries, list):
+                entries = [reply]
+            for entry in entries:
+                report_id = str(entry.get("report"))
+                if len(report_ids) == 1:
+                    report_id = report_ids[0]
+                entries_by_report.setdefault(report_id, []).append(entry)
+        except Exception as e:
+            print(f"AI Error: {e}")
+            return None
 
-    try:
-        response = chat.send_message(prompt)
-        text = response.text.replace("```json", "").replace("```", "")
-        print(text)
-        return json.loads(text)
-    except Exception as e:
-        print(f"AI Error: {e}")
-        return None
+    return {
+        report_id: merge_ai_results(entries)
+        for report_id, entries in entries_by_report.items()
+    }
 
 
-def update_csv(filename, data, month_label, author_name):
+def update_csv(filename, rows):
+    """
+    Appends one report row per (month_label, author_name, data) tuple,
+    opening the file once for the whole batch.
+    """
     headers = ["Month", "Name", "Project(s)", "Completed Tasks", "Next Steps"]
 
-    file_exists = os.path.isfile(filename)
-    try:
-        with open(filename, mode="a", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(file, fieldnames=headers)
-            if not file_exists:
-                writer.writeheader()
-
-            projects = data.get("projects", [])
-            project_str = (
-                ", ".join(projects) if isinstance(projects, list) else str(projects)
-            )
-
-            row = {
+    csv_rows = []
+    for month_label, author_name, data in rows:
+        projects = data.get("projects", [])
+        project_str = (
+            ", ".join(projects) if isinstance(projects, list) else str(projects)
+        )
+        csv_rows.append(
+            {
                 "Month": month_label,
                 "Name": author_name,
                 "Project(s)": project_str,
                 "Completed Tasks": data.get("completed_summary", ""),
                 "Next Steps": data.get("next_steps", ""),
             }
-            writer.writerow(row)
+        )
+
+    try:
+        with open(filename, mode="a", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=headers)
+            # Append mode opens at end of file, so an empty file needs a header.
+            if file.tell() == 0:
+                writer.writeheader()
+            writer.writerows(csv_rows)
             print(f"Success! Report appended to: {filename}")
     except IOError as e:
         print(f"Error writing to file: {e}")
@@ -178,24 +744,108 @@ def update_csv(filename, data, month_label, author_name):
 
 if __name__ == "__main__":
     args = parse_arguments()
-    start_d, end_d, month_lbl = calculate_dates(args)
-
-    all_content = []
-    for repo in args.repos:
-        repo_data = get_git_commits_with_diffs(args.aliases, start_d, end_d, repo)
-        if repo_data:
-            print(f"Extracted data from {repo}...")
-            all_content.append(repo_data)
-
-    if all_content:
-        full_payload = "\n".join(all_content)
-        with open(TEMP_DIFF_FILE, "w", encoding="utf-8") as f:
-            f.write(full_payload)
-
-        ai_data = run_gemini_pipeline(TEMP_DIFF_FILE)
-        if ai_data:
-            update_csv(args.output, ai_data, month_lbl, args.name)
-            if os.path.exists(TEMP_DIFF_FILE):
-                os.remove(TEMP_DIFF_FILE)
+    if args.batch_config:
+        try:
+            jobs = load_batch_config(args.batch_config)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error reading batch config {args.batch_config}: {e}")
+            sys.exit(1)
     else:
-        print("No commits found.")
+        jobs = [
+            make_report_job(
+                args.name, args.aliases, args.repos, args.last_month, args.dates
+            )
+        ]
+
+    cache = {} if args.no_cache else load_report_cache(CACHE_FILE)
+
+    for report_id, job in enumerate(jobs, 1):
+        job["report_id"] = str(report_id)
+        job["shas"] = []
+        job["cached_result"] = None
+
+    # Each (report, repo) pair is an independent `git log` subprocess, so run
+    # them concurrently. Every pair streams into its own spool file, which is
+    # copied into the payload in config order as soon as its turn comes up.
+    # Once all of a report's repos are in, a report whose exact commit set was
+    # summarized on a previous run is cut back out of the payload and its
+    # cached summary reused instead.
+    tasks = [(job, repo) for job in jobs for repo in job["repos"]]
+    payload = io.BytesIO()
+    max_workers = max(1, min(len(tasks), (os.cpu_count() or 1) * 2))
+    # Finished spools wait their turn while holding a file descriptor, so only
+    # keep a bounded number of tasks submitted ahead of the one being copied.
+    max_in_flight = max_workers * 2
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = collections.deque()
+        next_task = 0
+        for index, (job, repo) in enumerate(tasks):
+            while next_task < len(tasks) and len(pending) < max_in_flight:
+                task_job, task_repo = tasks[next_task]
+                pending.append(
+                    executor.submit(
+                        collect_repo_spool,
+                        task_job["alias_list"],
+                        task_job["start"],
+                        task_job["end"],
+                        task_repo,
+                    )
+                )
+                next_task += 1
+
+            shas, spool = pending.popleft().result()
+            if spool is not None:
+                with spool:
+                    print(f"Extracted data from {repo} for {job['name']}...")
+                    if not job["shas"]:
+                        job["payload_start"] = payload.tell()
+                        report_header = (
+                            f"=== REPORT {job['report_id']}: {job['name']} "
+                            f"({job['month_label']}) ===\n"
+                        )
+                        payload.write(report_header.encode("utf-8"))
+                    shutil.copyfileobj(spool, payload, length=STREAM_CHUNK_SIZE)
+                    job["shas"].extend(shas)
+
+            last_repo_of_job = index + 1 == len(tasks) or tasks[index + 1][0] is not job
+            if last_repo_of_job and job["shas"]:
+                job["cache_key"] = report_cache_key(job["alias_list"], job["shas"])
+                if job["cache_key"] in cache:
+                    print(f"Reusing cached summary for {job['name']}...")
+                    job["cached_result"] = cache[job["cache_key"]]
+                    payload.seek(job["payload_start"])
+                    payload.truncate()
+
+    # One AI request covers every report that is not cached.
+    ai_results = {}
+    if payload.tell():
+        ai_results = run_gemini_pipeline(
+            str(payload.getbuffer(), "utf-8", errors="replace"),
+            [
+                job["report_id"]
+                for job in jobs
+                if job["shas"] and job["cached_result"] is None
+            ],
+        )
+
+    report_rows = []
+    for job in jobs:
+        if not job["shas"]:
+            print(f"No commits found for {job['name']}.")
+            continue
+        ai_data = job["cached_result"]
+        if ai_data is None:
+            if ai_results is None:
+                continue
+            ai_data = ai_results.get(job["report_id"])
+            if ai_data is None:
+                print(f"Warning: no summary returned for {job['name']}.")
+                continue
+            if not args.no_cache:
+                cache[job["cache_key"]] = ai_data
+        report_rows.append((job["month_label"], job["name"], ai_data))
+
+    if ai_results and not args.no_cache:
+        save_report_cache(cache, CACHE_FILE)
+    if report_rows:
+        update_csv(args.output, report_rows)